@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from collections.abc import AsyncGenerator
@@ -49,6 +50,8 @@ _REASONING_END_MARKERS = ('","sql"', '", "sql"')
 class SSEEvent:
     """Base class for SSE events."""
 
+    __slots__ = ("data", "event")
+
     def __init__(self, event: str, data: dict[str, Any]) -> None:
         self.event = event
         self.data = data
@@ -57,7 +60,9 @@ class SSEEvent:
         return {"event": self.event, "data": self.data}
 
 
+@functools.cache
 def stage_event(stage: str) -> SSEEvent:
+    # Stage events carry no per-request data, so one shared instance per stage is yielded everywhere
     return SSEEvent("stage", {"stage": stage})
 
 
@@ -73,6 +78,12 @@ def reasoning_event(text: str) -> SSEEvent:
     return SSEEvent("reasoning", {"text": text})
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return a shared client per API key so its HTTP connection pool is reused across requests."""
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
 class _StreamResult:
     """Mutable holder for the final message from a streaming call."""
 
@@ -165,7 +176,7 @@ async def ask_question(
         yield error_event(f"Missing API key: set {config.llm.api_key_env} environment variable", "CONFIG_ERROR")
         return
 
-    client = anthropic.AsyncAnthropic(api_key=api_key)
+    client = _get_client(api_key)
     model = config.llm.model
 
     # Resolve parent cell for refinement
@@ -456,7 +467,7 @@ async def run_edited_sql(
 
     # Call 2: Narrate (async, non-streaming)
     yield stage_event("narrating")
-    client = anthropic.AsyncAnthropic(api_key=api_key)
+    client = _get_client(api_key)
     model = config.llm.model
     narrative_text, data_references = await _narrate(
         client, model, original_cell.question, sql, cell_result, locale=theme.locale
@@ -90,7 +90,8 @@ async def execute_query(
         # Convert to list of dicts
         data: list[dict[str, object]] = [dict(r) for r in rows]
 
-        cell_result = CellResult(
+        # Built from driver output we control: skip re-validating every row
+        cell_result = CellResult.model_construct(
             columns=columns,
             column_types=column_types,
             row_count=len(data),
@@ -6,6 +6,9 @@ including within CTEs.
 
 from __future__ import annotations
 
+import functools
+from typing import Any
+
 import pglast
 from pglast import visitors
 
@@ -43,30 +46,39 @@ class _ForbiddenNodeChecker(visitors.Visitor):  # type: ignore[misc]
             self.forbidden.append(tag)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse(sql: str) -> tuple[Any, ...] | pglast.parser.ParseError:
+    """Parse SQL into pglast statements, cached so re-validating the same text skips the parser.
+
+    Parse failures are cached too: the ParseError is returned rather than raised.
+    The returned AST is shared between callers and must not be mutated.
+    """
+    try:
+        return tuple(pglast.parse_sql(sql))
+    except pglast.parser.ParseError as e:
+        return e.with_traceback(None)
+
+
 def validate_sql(sql: str) -> Result[str]:
     """Validate that SQL is a single, safe SELECT statement.
 
     Returns Result with the cleaned SQL on success, or error diagnostics.
     """
-    result: Result[str] = Result()
-
     # Parse
-    try:
-        stmts = pglast.parse_sql(sql)
-    except pglast.parser.ParseError as e:
-        result.error("SQL_PARSE_ERROR", f"SQL parse error: {e}")
-        return result
+    stmts = _parse(sql)
+    if isinstance(stmts, pglast.parser.ParseError):
+        return Result.fail("SQL_PARSE_ERROR", f"SQL parse error: {stmts}")
 
     # Must be exactly one statement
     if len(stmts) != 1:
-        result.error("VALIDATION_ERROR", f"Expected 1 statement, got {len(stmts)}")
-        return result
+        return Result.fail("VALIDATION_ERROR", f"Expected 1 statement, got {len(stmts)}")
 
     # Top-level must be a SELECT
     top_stmt = stmts[0].stmt
     if type(top_stmt).__name__ != "SelectStmt":
-        result.error("VALIDATION_ERROR", f"Only SELECT statements allowed, got {type(top_stmt).__name__}")
-        return result
+        return Result.fail("VALIDATION_ERROR", f"Only SELECT statements allowed, got {type(top_stmt).__name__}")
+
+    result: Result[str] = Result()
 
     # Walk entire AST for forbidden nodes (catches DML in CTEs, subqueries, etc.)
     checker = _ForbiddenNodeChecker()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -17,6 +18,10 @@ from lumen.theme import load_theme
 
 logger = logging.getLogger("lumen.suggestions")
 
+# Optional ```json ... ``` fence around the JSON payload
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+
 
 class SuggestionsCache:
     """In-memory representation of cached suggestions."""
@@ -52,6 +57,12 @@ def save_suggestions_cache(connection_name: str, cache: SuggestionsCache) -> Non
     path.write_text(json.dumps({"schema_hash": cache.schema_hash, "suggestions": cache.suggestions}, indent=2) + "\n")
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """Return a shared client per API key so its HTTP connection pool is reused."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
 _SYSTEM_PROMPT = """\
 You are a data analyst assistant. Given the database schema below, generate 10 diverse, \
 natural-language questions that a business user might ask about this data.
@@ -69,12 +80,11 @@ natural-language questions that a business user might ask about this data.
 
 def generate_suggestions(schema_ctx: SchemaContext, config: LumenConfig) -> Result[list[str]]:
     """Generate suggestion questions via LLM, returning up to 10 questions."""
-    result: Result[list[str]] = Result()
-
     api_key = os.environ.get(config.llm.api_key_env, "")
     if not api_key:
-        result.error("CONFIG_ERROR", f"Missing API key: {config.llm.api_key_env}")
-        return result
+        return Result.fail("CONFIG_ERROR", f"Missing API key: {config.llm.api_key_env}")
+
+    result: Result[list[str]] = Result()
 
     schema_xml = to_xml(schema_ctx)
     theme = load_theme(config.active_connection)
@@ -84,7 +94,7 @@ def generate_suggestions(schema_ctx: SchemaContext, config: LumenConfig) -> Resu
     system = _SYSTEM_PROMPT.format(schema_xml=schema_xml, language_rule=language_rule)
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_client(api_key)
         response = client.messages.create(
             model=config.llm.model,
             max_tokens=1024,
@@ -105,8 +115,8 @@ def generate_suggestions(schema_ctx: SchemaContext, config: LumenConfig) -> Resu
             return result
 
         # Strip markdown fences if present
-        text = re.sub(r"^```(?:json)?\s*\n?", "", text.strip())
-        text = re.sub(r"\n?```\s*$", "", text.strip())
+        text = _FENCE_OPEN_RE.sub("", text.strip())
+        text = _FENCE_CLOSE_RE.sub("", text.strip())
 
         suggestions = json.loads(text)
         if not isinstance(suggestions, list):
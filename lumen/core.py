@@ -1,7 +1,7 @@
 """Core types used across all modules."""
 
 from enum import StrEnum
-from typing import Generic, TypeVar
+from typing import Generic, Self, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -33,6 +33,11 @@ class Result(BaseModel, Generic[T]):  # noqa: UP046 — Pydantic requires Generi
     data: T | None = None
     diagnostics: list[Diag] = Field(default_factory=list)
 
+    @classmethod
+    def fail(cls, code: str, message: str, *, hint: str | None = None) -> Self:
+        """Build a failed Result carrying a single error diagnostic."""
+        return cls(diagnostics=[Diag(severity=Severity.ERROR, code=code, message=message, hint=hint)])
+
     @property
     def has_errors(self) -> bool:
         return any(d.severity == Severity.ERROR for d in self.diagnostics)
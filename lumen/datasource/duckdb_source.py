@@ -161,7 +161,8 @@ class DuckDBSource:
             # Convert to list of dicts
             data: list[dict[str, object]] = [dict(zip(columns, row, strict=True)) for row in rows_raw]
 
-            cell_result = CellResult(
+            # Built from driver output we control: skip re-validating every row
+            cell_result = CellResult.model_construct(
                 columns=columns,
                 column_types=column_types,
                 row_count=len(data),
@@ -89,11 +89,10 @@ class NotebookStore:
 
     def load(self, notebook_id: str) -> Result[Notebook]:
         """Load a notebook from disk by ID."""
-        result: Result[Notebook] = Result()
         path = self._notebooks_dir / f"{notebook_id}.json"
         if not path.exists():
-            result.error("NOT_FOUND", f"Notebook {notebook_id} not found")
-            return result
+            return Result.fail("NOT_FOUND", f"Notebook {notebook_id} not found")
+        result: Result[Notebook] = Result()
         try:
             data = json.loads(path.read_text())
             nb = Notebook.model_validate(data)
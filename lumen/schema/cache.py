@@ -18,15 +18,15 @@ async def load_cached(project: str) -> SchemaContext | None:
     path = _cache_path(project)
     if not path.exists():
         return None
-    text = path.read_text()
-    return SchemaContext.model_validate_json(text)
+    return SchemaContext.model_validate_json(path.read_bytes())
 
 
 async def save_cache(project: str, ctx: SchemaContext) -> None:
     """Save a SchemaContext to disk."""
     path = _cache_path(project)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(ctx.model_dump(by_alias=True), indent=2, default=str) + "\n")
+    # Serialize directly in pydantic-core instead of model_dump() + json.dumps
+    path.write_bytes(ctx.model_dump_json(by_alias=True, indent=2).encode() + b"\n")
 
 
 def is_stale(project: str, current_hash: str) -> bool:
@@ -38,8 +38,7 @@ def is_stale(project: str, current_hash: str) -> bool:
     if not path.exists():
         return True
     try:
-        text = path.read_text()
-        cached = SchemaContext.model_validate_json(text)
+        cached = SchemaContext.model_validate_json(path.read_bytes())
         return cached.hash != current_hash
     except (json.JSONDecodeError, ValueError):
         return True
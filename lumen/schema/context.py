@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from xml.sax.saxutils import escape
 
 from pydantic import BaseModel, Field
@@ -23,10 +22,10 @@ def to_xml(ctx: SchemaContext) -> str:
     """Serialize a SchemaContext to XML format for the LLM system prompt."""
     s = ctx.enriched
     lines: list[str] = []
-    lines.append(f'<schema database="{escape(s.database)}" introspected_at="{escape(s.introspected_at)}">')
+    lines.append(f'<schema database="{_attr(s.database)}" introspected_at="{_attr(s.introspected_at)}">')
 
     for table in s.tables:
-        lines.append(_table_xml(table))
+        _append_table_xml(lines, table)
 
     if ctx.augmented_docs:
         lines.append("  <augmented_docs>")
@@ -37,59 +36,69 @@ def to_xml(ctx: SchemaContext) -> str:
     return "\n".join(lines)
 
 
-def _table_xml(table: EnrichedTable) -> str:
-    """Serialize a single table to XML."""
-    attrs = [f'name="{escape(table.name)}"']
+def _attr(value: str) -> str:
+    """Escape a value for a double-quoted XML attribute."""
+    return escape(value).replace('"', "&quot;")
+
+
+def _append_table_xml(lines: list[str], table: EnrichedTable) -> None:
+    """Serialize a single table to XML, appending to lines."""
+    attrs = [f'name="{_attr(table.name)}"']
     attrs.append(f'rows="~{table.row_count}"')
     if table.comment:
-        attrs.append(f'description="{escape(table.comment)}"')
+        attrs.append(f'description="{_attr(table.comment)}"')
 
-    lines: list[str] = []
     lines.append(f"  <table {' '.join(attrs)}>")
 
     for col in table.columns:
         lines.append(f"    {_column_xml(col)}")
 
     lines.append("  </table>")
-    return "\n".join(lines)
 
 
 def _column_xml(col: EnrichedColumn) -> str:
     """Serialize a single column to XML."""
-    attrs = [f'name="{escape(col.name)}"', f'type="{escape(col.data_type)}"']
+    attrs = [f'name="{_attr(col.name)}"', f'type="{_attr(col.data_type)}"']
 
     if col.role != "other":
-        attrs.append(f'role="{escape(col.role)}"')
+        attrs.append(f'role="{_attr(col.role)}"')
 
     if col.is_primary_key:
         attrs.append('pk="true"')
 
     if col.foreign_key:
-        attrs.append(f'fk="{escape(col.foreign_key)}"')
+        attrs.append(f'fk="{_attr(col.foreign_key)}"')
 
     if col.distinct_estimate is not None and col.role == "categorical":
         attrs.append(f'distinct_count="{col.distinct_estimate}"')
 
     if col.sample_values and col.role == "categorical":
         values_str = str(col.sample_values)
-        attrs.append(f'values="{escape(values_str)}"')
+        attrs.append(f'values="{_attr(values_str)}"')
 
     if col.min_value is not None and col.max_value is not None and col.role == "time_dimension":
-        attrs.append(f'range="{escape(col.min_value)} to {escape(col.max_value)}"')
+        attrs.append(f'range="{_attr(col.min_value)} to {_attr(col.max_value)}"')
 
     if col.suggested_agg:
-        attrs.append(f'suggested_agg="{escape(col.suggested_agg)}"')
+        attrs.append(f'suggested_agg="{_attr(col.suggested_agg)}"')
 
     if col.comment:
-        attrs.append(f'description="{escape(col.comment)}"')
+        attrs.append(f'description="{_attr(col.comment)}"')
 
     return f"<column {' '.join(attrs)}/>"
 
 
 def compute_hash(ctx: SchemaContext) -> str:
-    """Compute a deterministic SHA-256 hash of the schema context."""
-    # Use deterministic JSON serialization (sorted keys, no None)
-    data = ctx.enriched.model_dump(exclude_none=True)
-    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
-    h = hashlib.sha256(canonical.encode()).hexdigest()
-    return f"sha256:{h}"
+    """Compute a deterministic BLAKE2b hash of the schema context.
+
+    Only used for change detection, so a fast non-SHA-2 digest is sufficient.
+    """
+    # Serialize in pydantic-core: field order is fixed by the model definitions and the
+    # enriched schema holds no dicts, so the compact JSON is already canonical.
+    # Feed the hash one table at a time rather than materializing the whole schema's JSON.
+    s = ctx.enriched
+    h = hashlib.blake2b(digest_size=32)
+    h.update(s.model_dump_json(exclude={"tables"}, exclude_none=True).encode())
+    for table in s.tables:
+        h.update(table.model_dump_json(exclude_none=True).encode())
+    return f"blake2b:{h.hexdigest()}"
@@ -68,12 +68,11 @@ for each table that a non-technical user would understand.
 
 def generate_descriptions(schema_ctx: SchemaContext, config: LumenConfig) -> Result[dict[str, str]]:
     """Generate table descriptions via LLM."""
-    result: Result[dict[str, str]] = Result()
-
     api_key = os.environ.get(config.llm.api_key_env, "")
     if not api_key:
-        result.error("CONFIG_ERROR", f"Missing API key: {config.llm.api_key_env}")
-        return result
+        return Result.fail("CONFIG_ERROR", f"Missing API key: {config.llm.api_key_env}")
+
+    result: Result[dict[str, str]] = Result()
 
     schema_xml = to_xml(schema_ctx)
     theme = load_theme(config.active_connection)
@@ -51,9 +51,13 @@ _NUMERIC_TYPES = frozenset(
         "float8",
     }
 )
+_TEMPORAL_TYPES = _DATE_TYPES | _TIMESTAMP_TYPES
 _BOOLEAN_TYPES = frozenset({"boolean", "bool"})
 _STRING_TYPES = frozenset({"varchar", "character varying", "text", "char", "bpchar", "string"})
 
+# Type modifiers such as varchar(255) or numeric(10, 2)
+_TYPE_MODIFIER_RE = re.compile(r"\(.*\)")
+
 # Patterns for time column names (preferred -> fallback)
 _TIME_COLUMN_PATTERNS = [
     re.compile(r"^created_at$", re.IGNORECASE),
@@ -174,7 +178,7 @@ def _enrich_table(table: TableSnapshot) -> EnrichedTable:
 
 def _normalize_type(col_type: str) -> str:
     """Normalize a Postgres type string for matching."""
-    base = re.sub(r"\(.*\)", "", col_type).strip().lower()
+    base = _TYPE_MODIFIER_RE.sub("", col_type).strip().lower()
     return base
 
 
@@ -193,7 +197,7 @@ def _classify_role(col: ColumnSnapshot, row_count: int) -> str:
         return "key"
 
     # Time dimension: date/timestamp types
-    if norm in _DATE_TYPES or norm in _TIMESTAMP_TYPES:
+    if norm in _TEMPORAL_TYPES:
         return "time_dimension"
 
     # Boolean: always categorical
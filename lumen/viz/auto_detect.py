@@ -6,7 +6,8 @@ EnrichedSchema to classify columns by role.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from lumen.schema.enricher import EnrichedSchema
 from lumen.viz.theme import LUMEN_PALETTE, apply_theme
@@ -91,42 +92,48 @@ def auto_detect_chart(
             else:
                 cat_cols.append(col)
 
-    # Rule 1: No dims + single measure → KPI
-    if not time_cols and not cat_cols and len(measure_cols) == 1:
-        spec = _kpi_spec(measure_cols[0])
-        return apply_theme(spec, theme)
+    classified = _Classified(columns, time_cols, cat_cols, measure_cols, numeric_cols)
+    key = (bool(time_cols), bool(cat_cols), min(len(measure_cols), 2))
+    spec = _RULES.get(key, _fallback_spec)(classified)
+    return apply_theme(spec, theme)
 
-    # Rule 2a: Time + 2+ measures → stacked area (fold transform)
-    if time_cols and len(measure_cols) >= 2:
-        spec = _stacked_area_spec(time_cols[0], measure_cols)
-        return apply_theme(spec, theme)
 
-    # Rule 2b: Time + 1 measure → line
-    if time_cols and measure_cols:
-        spec = _line_spec(time_cols[0], measure_cols[0])
-        return apply_theme(spec, theme)
+class _Classified(NamedTuple):
+    """Result columns grouped by inferred role."""
 
-    # Rule 3: 1 categorical + measures → bar
-    if cat_cols and measure_cols:
-        spec = _bar_spec(cat_cols[0], measure_cols[0])
-        return apply_theme(spec, theme)
+    columns: list[str]
+    time_cols: list[str]
+    cat_cols: list[str]
+    measure_cols: list[str]
+    numeric_cols: list[str]
 
-    # Rule 4: 2+ numerics (no dims) → scatter
-    if len(numeric_cols) >= 2:
-        spec = _scatter_spec(numeric_cols[0], numeric_cols[1])
-        return apply_theme(spec, theme)
 
-    # Fallback → bar with first two columns
-    if len(columns) >= 2:
-        spec = _bar_spec(columns[0], columns[1])
-        return apply_theme(spec, theme)
+# Rule table keyed on (has time dim, has categorical dim, measure count capped at 2).
+# Measures and numerics are classified together, so the measure count covers both.
+_RULES: dict[tuple[bool, bool, int], Callable[[_Classified], dict[str, Any]]] = {
+    # Rule 1: No dims + single measure → KPI
+    (False, False, 1): lambda c: _kpi_spec(c.measure_cols[0]),
+    # Rule 2a: Time + 2+ measures → stacked area (fold transform)
+    (True, False, 2): lambda c: _stacked_area_spec(c.time_cols[0], c.measure_cols),
+    (True, True, 2): lambda c: _stacked_area_spec(c.time_cols[0], c.measure_cols),
+    # Rule 2b: Time + 1 measure → line
+    (True, False, 1): lambda c: _line_spec(c.time_cols[0], c.measure_cols[0]),
+    (True, True, 1): lambda c: _line_spec(c.time_cols[0], c.measure_cols[0]),
+    # Rule 3: 1 categorical + measures → bar
+    (False, True, 1): lambda c: _bar_spec(c.cat_cols[0], c.measure_cols[0]),
+    (False, True, 2): lambda c: _bar_spec(c.cat_cols[0], c.measure_cols[0]),
+    # Rule 4: 2+ numerics (no dims) → scatter
+    (False, False, 2): lambda c: _scatter_spec(c.numeric_cols[0], c.numeric_cols[1]),
+}
 
-    # Single column fallback
-    if columns:
-        spec = _kpi_spec(columns[0])
-        return apply_theme(spec, theme)
 
-    return apply_theme({"mark": "text", "encoding": {}})
+def _fallback_spec(c: _Classified) -> dict[str, Any]:
+    """Fallback when no rule matches: bar of the first two columns, or a KPI/text for fewer."""
+    if len(c.columns) >= 2:
+        return _bar_spec(c.columns[0], c.columns[1])
+    if c.columns:
+        return _kpi_spec(c.columns[0])
+    return {"mark": "text", "encoding": {}}
 
 
 def _build_role_map(enriched: EnrichedSchema) -> dict[str, str]:
@@ -2,26 +2,36 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from lumen.theme import ThemeConfig
 
-LUMEN_PALETTE = [
+LUMEN_PALETTE = (
     "#4A2D4F",
     "#C2876E",
     "#6B8F8A",
     "#B8A44C",
     "#8C7B6B",
     "#A3667E",
-]
+)
 
-LUMEN_THEME: dict[str, Any] = {
-    "config": {
-        "font": "DM Sans, system-ui, sans-serif",
+_DEFAULT_FONT = "DM Sans, system-ui, sans-serif"
+
+
+@functools.lru_cache(maxsize=16)
+def _config_for(font: str, palette: tuple[str, ...]) -> dict[str, Any]:
+    """Build the Vega-Lite config dict for a font and palette.
+
+    Cached: apply_theme shares the nested dicts between specs, so they must never be mutated.
+    """
+    return {
+        "font": font,
         "axis": {
-            "labelFont": "DM Sans, system-ui, sans-serif",
-            "titleFont": "DM Sans, system-ui, sans-serif",
+            "labelFont": font,
+            "titleFont": font,
             "labelFontSize": 11,
             "titleFontSize": 12,
             "titleFontWeight": 600,
@@ -33,41 +43,29 @@ LUMEN_THEME: dict[str, Any] = {
             "titlePadding": 12,
         },
         "legend": {
-            "labelFont": "DM Sans, system-ui, sans-serif",
-            "titleFont": "DM Sans, system-ui, sans-serif",
+            "labelFont": font,
+            "titleFont": font,
             "labelFontSize": 11,
             "titleFontSize": 12,
         },
         "title": {
-            "font": "DM Sans, system-ui, sans-serif",
+            "font": font,
             "fontSize": 14,
             "fontWeight": 600,
         },
-        "bar": {
-            "cornerRadiusEnd": 3,
-        },
-        "line": {
-            "strokeWidth": 2,
-            "point": {"size": 40},
-        },
-        "point": {
-            "size": 60,
-            "opacity": 0.7,
-        },
-        "area": {
-            "opacity": 0.7,
-            "line": True,
-        },
-        "range": {
-            "category": LUMEN_PALETTE,
-        },
-        "view": {
-            "strokeWidth": 0,
-        },
+        "bar": {"cornerRadiusEnd": 3},
+        "line": {"strokeWidth": 2, "point": {"size": 40}},
+        "point": {"size": 60, "opacity": 0.7},
+        "area": {"opacity": 0.7, "line": True},
+        "range": {"category": list(palette)},
+        "view": {"strokeWidth": 0},
         "padding": {"row": 10, "column": 10},
         "background": "transparent",
-    },
-}
+    }
+
+
+# Default theme config. A private copy, so it never aliases the cached dicts shared by themed specs.
+LUMEN_THEME: dict[str, Any] = {"config": copy.deepcopy(_config_for(_DEFAULT_FONT, LUMEN_PALETTE))}
 
 
 def apply_theme(spec: dict[str, Any], theme: ThemeConfig | None = None) -> dict[str, Any]:
@@ -75,20 +73,21 @@ def apply_theme(spec: dict[str, Any], theme: ThemeConfig | None = None) -> dict[
 
     When a ThemeConfig is provided, palette and fonts are derived from it.
     Otherwise, uses the hardcoded Lumen defaults for backward compatibility.
+    Nested config dicts are shared with the theme cache; only keys the spec
+    overrides get a freshly merged dict.
     """
     base_config = _build_config(theme)
 
     themed: dict[str, Any] = dict(spec)
-    # Merge config
-    existing_config: dict[str, Any] = dict(themed.get("config", {}))
-    for key, value in base_config.items():
-        if key not in existing_config:
-            existing_config[key] = value
-        elif isinstance(value, dict) and isinstance(existing_config[key], dict):
-            merged: dict[str, Any] = dict(value)
-            merged.update(existing_config[key])
-            existing_config[key] = merged
-    themed["config"] = existing_config
+    # Merge config: spec values win, dict values are merged key by key
+    config: dict[str, Any] = dict(base_config)
+    for key, value in themed.get("config", {}).items():
+        base_value = base_config.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            config[key] = {**base_value, **value}
+        else:
+            config[key] = value
+    themed["config"] = config
 
     # Set $schema if not present
     if "$schema" not in themed:
@@ -98,45 +97,10 @@ def apply_theme(spec: dict[str, Any], theme: ThemeConfig | None = None) -> dict[
 
 
 def _build_config(theme: ThemeConfig | None) -> dict[str, Any]:
-    """Build the Vega-Lite config dict from a theme or defaults."""
+    """Return the (cached) Vega-Lite config dict for a theme or defaults."""
     if theme is None:
-        return dict(LUMEN_THEME["config"])
+        return _config_for(_DEFAULT_FONT, LUMEN_PALETTE)
 
-    palette = theme.colors.resolved_palette()
+    palette = tuple(theme.colors.resolved_palette())
     font = f"{theme.fonts.body}, system-ui, sans-serif"
-
-    return {
-        "font": font,
-        "axis": {
-            "labelFont": font,
-            "titleFont": font,
-            "labelFontSize": 11,
-            "titleFontSize": 12,
-            "titleFontWeight": 600,
-            "gridDash": [3, 3],
-            "gridColor": "#E8E5DF",
-            "domainColor": "#CCCAC5",
-            "tickColor": "#CCCAC5",
-            "labelLimit": 150,
-            "titlePadding": 12,
-        },
-        "legend": {
-            "labelFont": font,
-            "titleFont": font,
-            "labelFontSize": 11,
-            "titleFontSize": 12,
-        },
-        "title": {
-            "font": font,
-            "fontSize": 14,
-            "fontWeight": 600,
-        },
-        "bar": {"cornerRadiusEnd": 3},
-        "line": {"strokeWidth": 2, "point": {"size": 40}},
-        "point": {"size": 60, "opacity": 0.7},
-        "area": {"opacity": 0.7, "line": True},
-        "range": {"category": palette},
-        "view": {"strokeWidth": 0},
-        "padding": {"row": 10, "column": 10},
-        "background": "transparent",
-    }
+    return _config_for(font, palette)
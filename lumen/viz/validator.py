@@ -17,11 +17,12 @@ def validate_chart_spec(spec: dict[str, Any], columns: list[str]) -> Result[dict
     Supports layered specs: if spec has 'layer', validates each layer independently.
     Returns the spec on success, diagnostics on failure.
     """
-    result: Result[dict[str, Any]] = Result()
-
     if not spec:
-        result.error("CHART_EMPTY", "Chart spec is empty")
-        return result
+        return Result.fail("CHART_EMPTY", "Chart spec is empty")
+
+    result: Result[dict[str, Any]] = Result()
+    # Built once and shared by every layer; empty means "skip field checks"
+    col_set = frozenset(columns)
 
     # Layered spec: validate each layer independently
     layers = spec.get("layer")
@@ -30,7 +31,7 @@ def validate_chart_spec(spec: dict[str, Any], columns: list[str]) -> Result[dict
             if not isinstance(layer, dict):
                 result.error("CHART_INVALID_LAYER", f"Layer {i} must be an object")
                 continue
-            layer_result = _validate_single_spec(layer, columns)
+            layer_result = _validate_single_spec(layer, columns, col_set)
             for diag in layer_result.diagnostics:
                 result.diagnostics.append(diag)
         if result.ok:
@@ -38,14 +39,14 @@ def validate_chart_spec(spec: dict[str, Any], columns: list[str]) -> Result[dict
         return result
 
     # Single spec
-    single_result = _validate_single_spec(spec, columns)
+    single_result = _validate_single_spec(spec, columns, col_set)
     result.diagnostics = single_result.diagnostics
     if result.ok:
         result.data = spec
     return result
 
 
-def _validate_single_spec(spec: dict[str, Any], columns: list[str]) -> Result[dict[str, Any]]:
+def _validate_single_spec(spec: dict[str, Any], columns: list[str], col_set: frozenset[str]) -> Result[dict[str, Any]]:
     """Validate a single (non-layered) Vega-Lite spec."""
     result: Result[dict[str, Any]] = Result()
 
@@ -54,7 +55,7 @@ def _validate_single_spec(spec: dict[str, Any], columns: list[str]) -> Result[di
     if mark is None:
         result.error("CHART_NO_MARK", "Chart spec missing 'mark'")
     else:
-        mark_type = mark if isinstance(mark, str) else mark.get("type") if isinstance(mark, dict) else None
+        mark_type = _mark_type(mark)
         if mark_type and mark_type not in _VALID_MARK_TYPES:
             result.error("CHART_INVALID_MARK", f"Invalid mark type: {mark_type}")
 
@@ -69,7 +70,6 @@ def _validate_single_spec(spec: dict[str, Any], columns: list[str]) -> Result[di
         return result
 
     # Validate encoded fields and types
-    col_set = set(columns)
     for channel, enc_def in encoding.items():
         if not isinstance(enc_def, dict):
             continue
@@ -81,3 +81,13 @@ def _validate_single_spec(spec: dict[str, Any], columns: list[str]) -> Result[di
             result.error("CHART_INVALID_TYPE", f"Invalid encoding type '{enc_type}' in {channel}")
 
     return result
+
+
+def _mark_type(mark: Any) -> Any:
+    """Return the mark type from a string or {"type": ...} mark, else None."""
+    kind = type(mark)
+    if kind is str:
+        return mark
+    if kind is dict:
+        return mark.get("type")
+    return None